@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import LoeApi
@@ -72,7 +73,7 @@ async def async_setup_entry(
         )
         return False
 
-    api = LoeApi(group=group)
+    api = LoeApi(group=group, session=async_get_clientsession(hass))
     coordinator = LoeOutagesCoordinator(hass, entry, api)
     entry.runtime_data = LoeOutagesData(
         api=api,
@@ -102,4 +103,7 @@ async def async_unload_entry(
 ) -> bool:
     """Handle removal of an entry."""
     LOGGER.info("Unload entry: %s", entry)
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.api.close()
+    return unload_ok
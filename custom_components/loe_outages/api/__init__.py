@@ -1,6 +1,12 @@
 """LOE Lviv Outages API package."""
 
-from .loe_api import LoeApi
+from .loe_api import LoeApi, find_current_and_next_outage
 from .models import OutageEvent, OutageEventType, OutageSlot
 
-__all__ = ["LoeApi", "OutageEvent", "OutageEventType", "OutageSlot"]
+__all__ = [
+    "LoeApi",
+    "OutageEvent",
+    "OutageEventType",
+    "OutageSlot",
+    "find_current_and_next_outage",
+]
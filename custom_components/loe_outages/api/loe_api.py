@@ -1,9 +1,13 @@
 """LOE Lviv outages API."""
 
+import bisect
 import datetime
 import logging
 import re
-from html import unescape
+import zoneinfo
+from collections.abc import Sequence
+from html.parser import HTMLParser
+from operator import attrgetter
 
 import aiohttp
 
@@ -12,24 +16,91 @@ from .models import OutageEvent, OutageEventType
 
 LOGGER = logging.getLogger(__name__)
 
+KIEV_TZ = zoneinfo.ZoneInfo("Europe/Kiev")
+
 # Regex patterns for parsing Ukrainian schedule text
 DATE_PATTERN = r"Графік погодинних відключень на (\d{2}\.\d{2}\.\d{4})"
 UPDATE_PATTERN = r"Інформація станом на (\d{2}:\d{2}) (\d{2}\.\d{2}\.\d{4})"
 GROUP_PATTERN = r"Група (\d\.\d)\.\s*Електроенергії немає\s+(.+?)\."
 TIME_RANGE_PATTERN = r"з (\d{2}:\d{2}) до (\d{2}:\d{2})"
 
+# Schedule date is followed by the update timestamp, match both in one scan.
+# re.ASCII limits \d to 0-9, times are converted byte-wise below.
+_HEADER_RE = re.compile(
+    rf"{DATE_PATTERN}(?:.*?{UPDATE_PATTERN})?", re.DOTALL | re.ASCII
+)
+_UPDATE_RE = re.compile(UPDATE_PATTERN, re.ASCII)
+_GROUP_RE = re.compile(GROUP_PATTERN, re.ASCII)
+_TIME_RANGE_RE = re.compile(TIME_RANGE_PATTERN, re.ASCII)
+_WS_RE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    """Collect text content of an HTML fragment."""
+
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+
+    def handle_data(self, data: str) -> None:
+        """Store a text chunk between tags."""
+        self.parts.append(data)
+
+
+def _html_to_text(raw_html: str) -> str:
+    """Convert an HTML fragment to whitespace-normalized text."""
+    parser = _TextExtractor()
+    parser.feed(raw_html)
+    parser.close()
+    return _WS_RE.sub(" ", " ".join(parser.parts)).strip()
+
+
+def find_current_and_next_outage(
+    events: Sequence[OutageEvent],
+    at: datetime.datetime,
+    *,
+    starts: Sequence[datetime.datetime] | None = None,
+    horizon: datetime.datetime | None = None,
+) -> tuple[OutageEvent | None, OutageEvent | None]:
+    """
+    Find the outage in progress and the next one starting after `at`.
+
+    Expects disjoint `events` sorted by start, `starts` is an optional
+    precomputed index of their start times. The next outage is dropped
+    if it starts at or after `horizon`.
+    """
+    i = (
+        bisect.bisect_right(starts, at)
+        if starts is not None
+        else bisect.bisect_right(events, at, key=attrgetter("start"))
+    )
+    current = events[i - 1] if i > 0 and at < events[i - 1].end else None
+    next_event = events[i] if i < len(events) else None
+    if next_event and horizon is not None and next_event.start >= horizon:
+        next_event = None
+    return current, next_event
+
 
 class LoeApi:
     """API for fetching LOE Lviv outages data."""
 
-    def __init__(self, group: str | None = None) -> None:
+    def __init__(
+        self,
+        group: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize the LoeApi."""
         self.group = group
+        self._session = session
+        self._owns_session = session is None
         self.raw_data = None
         self.schedule_text = None
         self.schedule_date = None
         self.updated_on = None
-        self.group_schedules = {}
+        self.group_schedules: dict[str, tuple[tuple[int, int], ...]] = {}
+        self._events_cache: dict[str, tuple[OutageEvent, ...]] = {}
+        self._starts_cache: dict[str, tuple[datetime.datetime, ...]] = {}
 
     async def _get_data(
         self,
@@ -49,10 +120,23 @@ class LoeApi:
             LOGGER.exception("Error fetching data from %s", url)
             return None
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating an owned one on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=2, keepalive_timeout=300),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by this instance."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def fetch_schedule_data(self) -> None:
         """Fetch schedule data from LOE API."""
-        async with aiohttp.ClientSession() as session:
-            self.raw_data = await self._get_data(session, LOE_API_ENDPOINT)
+        self.raw_data = await self._get_data(self._get_session(), LOE_API_ENDPOINT)
 
         if self.raw_data:
             self._extract_schedule_text()
@@ -72,11 +156,8 @@ class LoeApi:
                 if menu_items and len(menu_items) > 0:
                     # First menuItem is "Today" with rawHtml field
                     raw_html = menu_items[0].get("rawHtml", "")
-                    # Remove HTML tags and decode entities
-                    text = re.sub(r"<[^>]+>", " ", raw_html)
-                    text = unescape(text)
-                    # Clean up whitespace
-                    text = re.sub(r"\s+", " ", text).strip()
+                    # Parse HTML into plain text, entities are decoded by the parser
+                    text = _html_to_text(raw_html)
                     self.schedule_text = text
                     LOGGER.debug("Extracted schedule text: %s", text[:200])
         except (KeyError, IndexError, TypeError) as err:
@@ -88,14 +169,18 @@ class LoeApi:
         if not self.schedule_text:
             return
 
+        header_match = _HEADER_RE.search(self.schedule_text)
+        date_str, time_str, update_date_str = (
+            header_match.groups() if header_match else (None, None, None)
+        )
+        if not time_str and (update_match := _UPDATE_RE.search(self.schedule_text)):
+            # Update timestamp precedes the date or the date is missing
+            time_str, update_date_str = update_match.groups()
+
         # Extract schedule date
-        date_match = re.search(DATE_PATTERN, self.schedule_text)
-        if date_match:
-            date_str = date_match.group(1)
+        if date_str:
             try:
-                self.schedule_date = datetime.datetime.strptime(  # noqa: DTZ007
-                    date_str, "%d.%m.%Y"
-                ).date()
+                self.schedule_date = self._date_str_to_date(date_str)
                 LOGGER.debug("Parsed schedule date: %s", self.schedule_date)
             except ValueError as err:
                 LOGGER.warning("Failed to parse date %s: %s", date_str, err)
@@ -105,25 +190,25 @@ class LoeApi:
             self.schedule_date = None
 
         # Extract update timestamp
-        update_match = re.search(UPDATE_PATTERN, self.schedule_text)
-        if update_match:
-            time_str = update_match.group(1)
-            date_str = update_match.group(2)
+        if time_str and update_date_str:
             try:
-                # Parse as naive datetime and assume Europe/Kiev timezone
-                naive_dt = datetime.datetime.strptime(  # noqa: DTZ007
-                    f"{date_str} {time_str}", "%d.%m.%Y %H:%M"
+                # Local time in Europe/Kiev (UTC+2/UTC+3 with DST)
+                update_date = self._date_str_to_date(update_date_str)
+                self.updated_on = datetime.datetime(
+                    update_date.year,
+                    update_date.month,
+                    update_date.day,
+                    int(time_str[0:2]),
+                    int(time_str[3:5]),
+                    tzinfo=KIEV_TZ,
                 )
-                # Add timezone info (Europe/Kiev is UTC+2/UTC+3 with DST)
-                # Using replace with a fixed offset for simplicity
-                import zoneinfo  # noqa: PLC0415
-
-                kiev_tz = zoneinfo.ZoneInfo("Europe/Kiev")
-                self.updated_on = naive_dt.replace(tzinfo=kiev_tz)
                 LOGGER.debug("Parsed update time: %s", self.updated_on)
-            except (ValueError, ImportError) as err:
+            except ValueError as err:
                 LOGGER.warning(
-                    "Failed to parse update time %s %s: %s", time_str, date_str, err
+                    "Failed to parse update time %s %s: %s",
+                    time_str,
+                    update_date_str,
+                    err,
                 )
                 self.updated_on = None
         else:
@@ -132,101 +217,128 @@ class LoeApi:
 
         # Extract group schedules
         self.group_schedules = {}
-        for group_match in re.finditer(GROUP_PATTERN, self.schedule_text):
+        for group_match in _GROUP_RE.finditer(self.schedule_text):
             group_num = group_match.group(1)
-            time_ranges_text = group_match.group(2)
 
-            # Parse time ranges for this group
+            # Parse time ranges for this group into (start, end) minutes
             time_ranges = []
-            for time_match in re.finditer(TIME_RANGE_PATTERN, time_ranges_text):
-                start_str = time_match.group(1)
-                end_str = time_match.group(2)
-                time_ranges.append((start_str, end_str))
-
-            self.group_schedules[group_num] = time_ranges
-            LOGGER.debug("Parsed group %s: %s ranges", group_num, len(time_ranges))
+            for time_match in _TIME_RANGE_RE.finditer(group_match.group(2)):
+                start_str, end_str = time_match.groups()
+                try:
+                    start = self._time_str_to_minutes(start_str)
+                    end = self._time_str_to_minutes(end_str)
+                except ValueError as err:
+                    LOGGER.warning(
+                        "Failed to parse time range %s-%s: %s", start_str, end_str, err
+                    )
+                    continue
+                # Handle time range crossing midnight, 1440 is end of day
+                time_ranges.append((start, end if end >= start else 1440))
+
+            self.group_schedules[group_num] = self._join_ranges(time_ranges)
+            LOGGER.debug(
+                "Parsed group %s: %s ranges",
+                group_num,
+                len(self.group_schedules[group_num]),
+            )
 
-    def _time_str_to_minutes(self, time_str: str) -> int:
+        # Schedule changed, drop events built from the previous one
+        self._events_cache.clear()
+        self._starts_cache.clear()
+
+    @staticmethod
+    def _join_ranges(
+        time_ranges: list[tuple[int, int]],
+    ) -> tuple[tuple[int, int], ...]:
+        """Sort minute ranges and join overlapping or touching ones."""
+        # Event lookups bisect on start and rely on disjoint ranges
+        joined: list[tuple[int, int]] = []
+        for start, end in sorted(time_ranges):
+            if joined and start <= joined[-1][1]:
+                last_start, last_end = joined[-1]
+                joined[-1] = (last_start, max(last_end, end))
+            else:
+                joined.append((start, end))
+        return tuple(joined)
+
+    @staticmethod
+    def _date_str_to_date(date_str: str) -> datetime.date:
+        """Convert date string DD.MM.YYYY to date."""
+        # Fixed-width ASCII digits are guaranteed by _HEADER_RE/_UPDATE_RE
+        return datetime.date(
+            int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2])
+        )
+
+    @staticmethod
+    def _time_str_to_minutes(time_str: str) -> int:
         """Convert time string HH:MM to minutes since midnight."""
-        hours, minutes = map(int, time_str.split(":"))
-        return hours * 60 + minutes
+        # Fixed-width ASCII digits are guaranteed by _TIME_RANGE_RE
+        b = time_str.encode()
+        hours = (b[0] - 48) * 10 + (b[1] - 48)
+        minutes = (b[3] - 48) * 10 + (b[4] - 48)
+        total = hours * 60 + minutes
+        # 24:00 is the only valid time past the end of day
+        if minutes >= 60 or total > 1440:  # noqa: PLR2004
+            msg = f"Invalid time {time_str}"
+            raise ValueError(msg)
+        return total
 
     def _minutes_to_datetime(
-        self, minutes: int, date: datetime.date
+        self, minutes: int, day_start: datetime.datetime
     ) -> datetime.datetime:
-        """Convert minutes from start of day to datetime with Europe/Kiev timezone."""
-        import zoneinfo  # noqa: PLC0415
-
-        hours = minutes // 60
-        mins = minutes % 60
-        kiev_tz = zoneinfo.ZoneInfo("Europe/Kiev")
-
-        # Handle end of day (24:00) - use midnight of next day
-        if hours == 24:  # noqa: PLR2004
-            next_day = date + datetime.timedelta(days=1)
-            naive_dt = datetime.datetime.combine(next_day, datetime.time(0, 0))
-        else:
-            naive_dt = datetime.datetime.combine(date, datetime.time(hours, mins))
-
-        # Make timezone-aware
-        return naive_dt.replace(tzinfo=kiev_tz)
+        """Convert minutes from start of day to datetime (24:00 is next midnight)."""
+        return day_start + datetime.timedelta(minutes=minutes)
 
-    def get_events_for_group(self, group: str) -> list[OutageEvent]:
+    def get_events_for_group(self, group: str) -> tuple[OutageEvent, ...]:
         """Get outage events for a specific group."""
         if not self.schedule_date or group not in self.group_schedules:
-            return []
+            return ()
 
-        events = []
-        time_ranges = self.group_schedules[group]
+        if (cached := self._events_cache.get(group)) is not None:
+            return cached
 
-        for start_str, end_str in time_ranges:
-            try:
-                start_minutes = self._time_str_to_minutes(start_str)
-                end_minutes = self._time_str_to_minutes(end_str)
-
-                # Handle time range crossing midnight
-                if end_minutes < start_minutes or end_str == "24:00":
-                    end_minutes = 1440  # End of day
-
-                start_dt = self._minutes_to_datetime(start_minutes, self.schedule_date)
-                end_dt = self._minutes_to_datetime(end_minutes, self.schedule_date)
-
-                events.append(
-                    OutageEvent(
-                        event_type=OutageEventType.DEFINITE,
-                        start=start_dt,
-                        end=end_dt,
-                    )
-                )
-            except (ValueError, AttributeError) as err:
-                LOGGER.warning(
-                    "Failed to parse time range %s-%s: %s", start_str, end_str, err
-                )
-                continue
+        time_ranges = self.group_schedules[group]
+        day_start = datetime.datetime(
+            self.schedule_date.year,
+            self.schedule_date.month,
+            self.schedule_date.day,
+            tzinfo=KIEV_TZ,
+        )
+
+        # Ranges are sorted at parse time, so events are already chronological.
+        # Cached events are shared between callers, hence immutable tuples.
+        events = tuple(
+            OutageEvent(
+                event_type=OutageEventType.DEFINITE,
+                start=self._minutes_to_datetime(start_minutes, day_start),
+                end=self._minutes_to_datetime(end_minutes, day_start),
+            )
+            for start_minutes, end_minutes in time_ranges
+        )
+        self._events_cache[group] = events
+        self._starts_cache[group] = tuple(event.start for event in events)
+        return events
+
+    def _get_indexed_events(
+        self, group: str
+    ) -> tuple[tuple[OutageEvent, ...], tuple[datetime.datetime, ...]]:
+        """Get sorted events for a group along with their start times."""
+        events = self.get_events_for_group(group)
+        return events, self._starts_cache.get(group, ())
+
+    def get_current_and_next(
+        self, at: datetime.datetime
+    ) -> tuple[OutageEvent | None, OutageEvent | None]:
+        """Get the current outage event and the next one after a given time."""
+        if not self.group:
+            return None, None
 
-        return sorted(events, key=lambda e: e.start)
+        events, starts = self._get_indexed_events(self.group)
+        return find_current_and_next_outage(events, at, starts=starts)
 
     def get_current_event(self, at: datetime.datetime) -> OutageEvent | None:
         """Get the current outage event at a given time."""
-        if not self.group:
-            return None
-
-        events = self.get_events_for_group(self.group)
-        for event in events:
-            if event.start <= at < event.end:
-                return event
-        return None
-
-    def get_next_event(self, at: datetime.datetime) -> OutageEvent | None:
-        """Get the next outage event after a given time."""
-        if not self.group:
-            return None
-
-        events = self.get_events_for_group(self.group)
-        for event in events:
-            if event.start > at:
-                return event
-        return None
+        return self.get_current_and_next(at)[0]
 
     def get_events_between(
         self,
@@ -237,19 +349,15 @@ class LoeApi:
         if not self.group:
             return []
 
-        events = self.get_events_for_group(self.group)
-
-        # Filter events that intersect with the requested range
-        return [
-            event
-            for event in events
-            if (
-                start_date <= event.start <= end_date
-                or start_date <= event.end <= end_date
-                or event.start <= start_date <= event.end
-                or event.start <= end_date <= event.end
-            )
-        ]
+        events, starts = self._get_indexed_events(self.group)
+
+        # Overlap with [start, end): events starting before end_date, plus the
+        # earlier ones still running at start_date
+        lo = bisect.bisect_left(starts, start_date)
+        hi = bisect.bisect_left(starts, end_date)
+        while lo > 0 and events[lo - 1].end > start_date:
+            lo -= 1
+        return list(events[lo:hi])
 
     def get_schedule_updated_on(self) -> datetime.datetime | None:
         """Get the timestamp when the schedule was last updated."""
@@ -1,7 +1,7 @@
 """Data models for LOE Lviv outages API."""
 
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 
 
@@ -11,16 +11,22 @@ class OutageEventType(StrEnum):
     DEFINITE = "Definite"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutageEvent:
     """Represents an outage event."""
 
     event_type: OutageEventType
     start: datetime.datetime
     end: datetime.datetime
+    uid: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Precompute the calendar event uid."""
+        # Frozen dataclass, bypass the blocked __setattr__
+        object.__setattr__(self, "uid", f"outage-{self.start.isoformat()}")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class OutageSlot:
     """Represents an outage time slot template."""
 
@@ -29,7 +29,7 @@ def to_calendar_event(
         start=event.start,
         end=event.end,
         description=event.event_type.value,
-        uid=f"outage-{event.start.isoformat()}",
+        uid=event.uid,
     )
     LOGGER.debug("Calendar Event: %s", calendar_event)
     return calendar_event
@@ -1,9 +1,10 @@
 """Config flow for LOE Lviv Outages integration."""
 
+from __future__ import annotations
+
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import voluptuous as vol
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -11,13 +12,12 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.selector import (
-    SelectSelector,
-    SelectSelectorConfig,
-)
 
 from .const import AVAILABLE_GROUPS, CONF_GROUP, DOMAIN
 
+if TYPE_CHECKING:
+    import voluptuous as vol
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -39,6 +39,13 @@ def build_entry_title(data: dict[str, Any]) -> str:
 
 def build_group_schema(config_entry: ConfigEntry | None) -> vol.Schema:
     """Build the schema for the group selection step."""
+    # Only needed when a flow form is shown, keep them off the setup import path
+    import voluptuous as vol  # noqa: PLC0415
+    from homeassistant.helpers.selector import (  # noqa: PLC0415
+        SelectSelector,
+        SelectSelectorConfig,
+    )
+
     return vol.Schema(
         {
             vol.Required(
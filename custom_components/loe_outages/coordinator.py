@@ -11,7 +11,7 @@ from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_utils
 
-from .api import LoeApi, OutageEvent, OutageEventType
+from .api import LoeApi, OutageEvent, OutageEventType, find_current_and_next_outage
 from .const import (
     CONF_GROUP,
     DOMAIN,
@@ -35,17 +35,6 @@ EVENT_TYPE_STATE_MAP: dict[OutageEventType, str] = {
 }
 
 
-def find_next_outage(
-    events: list[OutageEvent],
-    now: datetime.datetime,
-) -> OutageEvent | None:
-    """Find the next outage event that starts after the given time."""
-    for event in events:
-        if event.start > now:
-            return event
-    return None
-
-
 class LoeOutagesCoordinator(DataUpdateCoordinator):
     """Class to manage fetching LOE Lviv outages data."""
 
@@ -86,6 +75,9 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
         # Use the provided API instance
         self.api = api
 
+        # Merged group events, rebuilt once per fetch
+        self._merged_events: list[OutageEvent] = []
+
     async def _async_update_data(self) -> None:
         """Fetch data from LOE API."""
         await self.async_fetch_translations()
@@ -97,6 +89,19 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
             msg = f"Failed to fetch schedule data: {err}"
             raise UpdateFailed(msg) from err
 
+        self._rebuild_events()
+
+    def _rebuild_events(self) -> None:
+        """Rebuild cached merged outages from API data."""
+        try:
+            events = self.api.get_events_for_group(self.group)
+        except Exception:  # noqa: BLE001
+            LOGGER.warning(
+                "Failed to get events for group %s", self.group, exc_info=True
+            )
+            events = []
+        self._merged_events = merge_consecutive_outages(events)
+
     def _event_to_state(self, event: OutageEvent | None) -> str:
         """Map outage event to electricity state."""
         if not event:
@@ -120,14 +125,7 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
     @property
     def current_event(self) -> OutageEvent | None:
         """Get the current event."""
-        try:
-            return self.api.get_current_event(dt_utils.now())
-        except Exception:  # noqa: BLE001
-            LOGGER.warning(
-                "Failed to get current event, sensors will show unknown state",
-                exc_info=True,
-            )
-            return None
+        return self.get_outage_at(dt_utils.now())
 
     @property
     def current_state(self) -> str:
@@ -142,13 +140,8 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
     @property
     def next_outage(self) -> datetime.date | datetime.datetime | None:
         """Get the next outage time."""
-        now = dt_utils.now()
-        events = self.get_merged_outages(
-            now,
-            OUTAGE_LOOKAHEAD,
-        )
-
-        if event := find_next_outage(events, now):
+        _, event = self._get_current_and_next_outage(dt_utils.now())
+        if event:
             LOGGER.debug("Next outage: %s", event)
             return event.start
 
@@ -157,21 +150,16 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
     @property
     def next_connectivity(self) -> datetime.date | datetime.datetime | None:
         """Get next connectivity time."""
-        now = dt_utils.now()
-        events = self.get_merged_outages(
-            now,
-            OUTAGE_LOOKAHEAD,
-        )
+        current, next_event = self._get_current_and_next_outage(dt_utils.now())
 
         # Check if we are in an outage
-        for event in events:
-            if event.start <= now < event.end:
-                return event.end
+        if current:
+            return current.end
 
         # Find next outage
-        if event := find_next_outage(events, now):
-            LOGGER.debug("Next connectivity event: %s", event)
-            return event.end
+        if next_event:
+            LOGGER.debug("Next connectivity event: %s", next_event)
+            return next_event.end
 
         return None
 
@@ -180,10 +168,14 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
         at: datetime.datetime,
     ) -> OutageEvent | None:
         """Get an outage event at a given time."""
+        # API keeps an index of event starts, a single bisect per lookup
         try:
             return self.api.get_current_event(at)
         except Exception:  # noqa: BLE001
-            LOGGER.warning("Failed to get current outage", exc_info=True)
+            LOGGER.warning(
+                "Failed to get current outage, sensors will show unknown state",
+                exc_info=True,
+            )
             return None
 
     def get_events_between(
@@ -193,7 +185,8 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
     ) -> list[OutageEvent]:
         """Get outage events within the date range."""
         try:
-            events = self.api.get_events_between(start_date, end_date)
+            # API returns events already sorted by start
+            return self.api.get_events_between(start_date, end_date)
         except Exception:  # noqa: BLE001
             LOGGER.warning(
                 'Failed to get events between "%s" -> "%s"',
@@ -203,14 +196,13 @@ class LoeOutagesCoordinator(DataUpdateCoordinator):
             )
             return []
 
-        return sorted(events, key=lambda event: event.start)
-
-    def get_merged_outages(
+    def _get_current_and_next_outage(
         self,
-        start_date: datetime.datetime,
-        lookahead_days: int,
-    ) -> list[OutageEvent]:
-        """Get merged outage events for a lookahead period."""
-        end_date = start_date + datetime.timedelta(days=lookahead_days)
-        events = self.get_events_between(start_date, end_date)
-        return merge_consecutive_outages(events)
+        now: datetime.datetime,
+    ) -> tuple[OutageEvent | None, OutageEvent | None]:
+        """Get merged outage in progress and the next one within the lookahead."""
+        return find_current_and_next_outage(
+            self._merged_events,
+            now,
+            horizon=now + datetime.timedelta(days=OUTAGE_LOOKAHEAD),
+        )
@@ -7,16 +7,85 @@ https://developers.home-assistant.io/docs/core/integration_diagnostics
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from .const import CONF_GROUP
+from .helpers import to_isoformat
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from homeassistant.core import HomeAssistant
 
     from .data import LoeOutagesConfigEntry
 
 
+# Static "entry" section, built once per loaded entry and dropped on unload
+_ENTRY_DIAGNOSTICS_CACHE: dict[str, dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=32, typed=True)
+def _to_str(value: Any) -> str:
+    """Convert a hashable value to string, memoized per value and type."""
+    return str(value)
+
+
+def _iter_repr(obj: Any) -> Iterator[str]:
+    """Yield repr of JSON-like data chunk by chunk."""
+    if isinstance(obj, dict):
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            yield f"{', ' if i else ''}{key!r}: "
+            yield from _iter_repr(value)
+        yield "}"
+    elif isinstance(obj, list):
+        yield "["
+        for i, value in enumerate(obj):
+            if i:
+                yield ", "
+            yield from _iter_repr(value)
+        yield "]"
+    else:
+        yield repr(obj)
+
+
+def _truncated_repr(obj: Any, limit: int = 1000) -> str:
+    """Return the first `limit` chars of repr(obj) without rendering the rest."""
+    parts = []
+    size = 0
+    for chunk in _iter_repr(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def _get_entry_diagnostics(entry: LoeOutagesConfigEntry) -> dict[str, Any]:
+    """Return static diagnostics of the config entry, cached until unload."""
+    entry_id = entry.entry_id
+    if (cached := _ENTRY_DIAGNOSTICS_CACHE.get(entry_id)) is not None:
+        return cached
+
+    cached = _ENTRY_DIAGNOSTICS_CACHE[entry_id] = {
+        "entry_id": entry_id,
+        "version": entry.version,
+        "minor_version": entry.minor_version,
+        "domain": entry.domain,
+        "title": entry.title,
+        "data": {
+            "group": entry.data.get(CONF_GROUP),
+        },
+        "options": {
+            "group": entry.options.get(CONF_GROUP),
+        },
+    }
+    # Any entry update reloads the integration, which unloads the entry first
+    entry.async_on_unload(lambda: _ENTRY_DIAGNOSTICS_CACHE.pop(entry_id, None))
+    return cached
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,  # noqa: ARG001
     entry: LoeOutagesConfigEntry,
@@ -24,57 +93,38 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data.coordinator
     api = entry.runtime_data.api
-    data = entry.data
+    # Coordinator properties compute on access, read each one once
+    schedule_updated_on = coordinator.schedule_updated_on
+    next_outage = coordinator.next_outage
+    next_connectivity = coordinator.next_connectivity
+    schedule_text = api.schedule_text
 
     # Build diagnostics safely, handling None values
     return {
-        "entry": {
-            "entry_id": entry.entry_id,
-            "version": entry.version,
-            "minor_version": entry.minor_version,
-            "domain": entry.domain,
-            "title": entry.title,
-            "state": str(entry.state),
-            "data": {
-                "group": data.get(CONF_GROUP),
-            },
-            "options": {
-                "group": entry.options.get(CONF_GROUP),
-            },
-        },
+        "entry": _get_entry_diagnostics(entry),
+        # State changes while the entry stays loaded, so it is kept out of the cache
+        "entry_state": _to_str(entry.state),
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
-            "update_interval": str(coordinator.update_interval),
+            "update_interval": _to_str(coordinator.update_interval),
             "group": coordinator.group,
             "current_state": coordinator.current_state,
-            "schedule_updated_on": (
-                coordinator.schedule_updated_on.isoformat()
-                if coordinator.schedule_updated_on
-                else None
-            ),
-            "next_outage": (
-                coordinator.next_outage.isoformat() if coordinator.next_outage else None
-            ),
-            "next_connectivity": (
-                coordinator.next_connectivity.isoformat()
-                if coordinator.next_connectivity
-                else None
-            ),
+            "schedule_updated_on": to_isoformat(schedule_updated_on),
+            "next_outage": to_isoformat(next_outage),
+            "next_connectivity": to_isoformat(next_connectivity),
         },
         "api": {
             "group": api.group,
-            "schedule_date": str(api.schedule_date) if api.schedule_date else None,
-            "updated_on": api.updated_on.isoformat() if api.updated_on else None,
-            "schedule_text": api.schedule_text[:500] if api.schedule_text else None,
-            "schedule_text_length": (
-                len(api.schedule_text) if api.schedule_text else 0
-            ),
-            "group_schedules": {
-                group: [(start, end) for start, end in ranges]
-                for group, ranges in api.group_schedules.items()
-            },
+            "schedule_date": _to_str(api.schedule_date) if api.schedule_date else None,
+            "updated_on": to_isoformat(api.updated_on),
+            "schedule_text": schedule_text[:500] if schedule_text else None,
+            "schedule_text_length": len(schedule_text) if schedule_text else 0,
+            # Values are immutable tuples, a shallow copy is enough
+            "group_schedules": dict(api.group_schedules),
             "raw_data_keys": list(api.raw_data.keys()) if api.raw_data else None,
-            "raw_data_sample": (str(api.raw_data)[:1000] if api.raw_data else None),
+            "raw_data_sample": (
+                _truncated_repr(api.raw_data) if api.raw_data else None
+            ),
         },
         "error": {
             "last_exception": (
@@ -1,26 +1,45 @@
 """LOE Lviv Outages entity."""
 
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LoeOutagesCoordinator
 
+if TYPE_CHECKING:
+    from homeassistant.helpers.device_registry import DeviceInfo
+
+# Entities of one entry share a single DeviceInfo, dropped when the entry unloads
+_DEVICE_INFO_CACHE: dict[tuple[str, str], DeviceInfo] = {}
+
 
 class LoeOutagesEntity(CoordinatorEntity[LoeOutagesCoordinator]):
     """Common logic for LOE Lviv Outages entity."""
 
     _attr_has_entity_name = True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this entity."""
-        return DeviceInfo(
-            translation_key="loe_lviv_outages",
-            translation_placeholders={
-                "group": str(self.coordinator.group),
-            },
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            manufacturer="Львівобленерго",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+    def __init__(self, coordinator: LoeOutagesCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        entry = coordinator.config_entry
+        group = str(coordinator.group)
+        key = (entry.entry_id, group)
+        if (device_info := _DEVICE_INFO_CACHE.get(key)) is None:
+            # Deferred until the first entity of an entry is built
+            from homeassistant.helpers.device_registry import (  # noqa: PLC0415
+                DeviceEntryType,
+                DeviceInfo,
+            )
+
+            device_info = _DEVICE_INFO_CACHE[key] = DeviceInfo(
+                translation_key="loe_lviv_outages",
+                translation_placeholders={"group": group},
+                identifiers={(DOMAIN, entry.entry_id)},
+                manufacturer="Львівобленерго",
+                entry_type=DeviceEntryType.SERVICE,
+            )
+            entry.async_on_unload(lambda: _DEVICE_INFO_CACHE.pop(key, None))
+        self._attr_device_info = device_info
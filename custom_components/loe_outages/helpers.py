@@ -2,10 +2,36 @@
 
 from __future__ import annotations
 
+import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from .api import OutageEvent
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@lru_cache(maxsize=64)
+def _isoformat(value: datetime.date, _offset: datetime.timedelta | None) -> str:
+    """Format a value as ISO 8601, cached per value and UTC offset."""
+    return value.isoformat()
+
+
+def to_isoformat(value: datetime.date | None) -> str | None:
+    """
+    Format a date/datetime as ISO 8601, memoized across calls.
+
+    Aware datetimes compare equal across timezones, so the UTC offset
+    is part of the cache key.
+    """
+    if value is None:
+        return None
+    offset = value.utcoffset() if isinstance(value, datetime.datetime) else None
+    return _isoformat(value, offset)
+
 
-def merge_consecutive_outages(events: list[OutageEvent]) -> list[OutageEvent]:
+def merge_consecutive_outages(events: Sequence[OutageEvent]) -> list[OutageEvent]:
     """
     Merge consecutive outage events with identical type/source.
 
@@ -21,13 +47,11 @@ def merge_consecutive_outages(events: list[OutageEvent]) -> list[OutageEvent]:
         if (
             current_event.end == next_event.start
             and current_event.event_type == next_event.event_type
-            and current_event.source == next_event.source
         ):
             current_event = OutageEvent(
                 start=current_event.start,
                 end=next_event.end,
                 event_type=current_event.event_type,
-                source=current_event.source,
             )
         else:
             merged.append(current_event)
@@ -3,6 +3,7 @@
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,7 +12,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.const import STATE_UNKNOWN, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -24,15 +25,27 @@ from .const import (
 from .coordinator import LoeOutagesCoordinator
 from .data import LoeOutagesConfigEntry
 from .entity import LoeOutagesEntity
+from .helpers import to_isoformat
 
 LOGGER = logging.getLogger(__name__)
 
 
+def get_event_attributes(coordinator: LoeOutagesCoordinator) -> dict[str, Any]:
+    """Return attributes describing the current outage event."""
+    event = coordinator.current_event
+    return {
+        ATTR_EVENT_TYPE: event.event_type.value if event else STATE_UNKNOWN,
+        ATTR_EVENT_START: to_isoformat(event.start) if event else None,
+        ATTR_EVENT_END: to_isoformat(event.end) if event else None,
+    }
+
+
 @dataclass(frozen=True, kw_only=True)
 class LoeOutagesSensorDescription(SensorEntityDescription):
     """LOE Outages entity description."""
 
     val_func: Callable[[LoeOutagesCoordinator], Any]
+    attrs_func: Callable[[LoeOutagesCoordinator], dict[str, Any] | None] | None = None
 
 
 SENSOR_TYPES: tuple[LoeOutagesSensorDescription, ...] = (
@@ -42,21 +55,22 @@ SENSOR_TYPES: tuple[LoeOutagesSensorDescription, ...] = (
         icon="mdi:transmission-tower",
         device_class=SensorDeviceClass.ENUM,
         options=[STATE_NORMAL, STATE_OUTAGE, STATE_UNKNOWN],
-        val_func=lambda coordinator: coordinator.current_state,
+        val_func=attrgetter("current_state"),
+        attrs_func=get_event_attributes,
     ),
     LoeOutagesSensorDescription(
         key="next_outage",
         translation_key="next_outage",
         icon="mdi:calendar-remove",
         device_class=SensorDeviceClass.TIMESTAMP,
-        val_func=lambda coordinator: coordinator.next_outage,
+        val_func=attrgetter("next_outage"),
     ),
     LoeOutagesSensorDescription(
         key="next_connectivity",
         translation_key="next_connectivity",
         icon="mdi:calendar-check",
         device_class=SensorDeviceClass.TIMESTAMP,
-        val_func=lambda coordinator: coordinator.next_connectivity,
+        val_func=attrgetter("next_connectivity"),
     ),
     LoeOutagesSensorDescription(
         key="schedule_updated_on",
@@ -64,7 +78,7 @@ SENSOR_TYPES: tuple[LoeOutagesSensorDescription, ...] = (
         icon="mdi:update",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
-        val_func=lambda coordinator: coordinator.schedule_updated_on,
+        val_func=attrgetter("schedule_updated_on"),
     ),
 )
 
@@ -78,7 +92,7 @@ async def async_setup_entry(
     LOGGER.debug("Setup new entry: %s", config_entry)
     coordinator = config_entry.runtime_data.coordinator
     async_add_entities(
-        LoeOutagesSensor(coordinator, description) for description in SENSOR_TYPES
+        [LoeOutagesSensor(coordinator, description) for description in SENSOR_TYPES]
     )
 
 
@@ -101,20 +115,17 @@ class LoeOutagesSensor(LoeOutagesEntity, SensorEntity):
             f"{self.entity_description.key}"
         )
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        return self.entity_description.val_func(self.coordinator)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional attributes for the electricity sensor."""
-        if self.entity_description.key != "electricity":
-            return None
-        # Get the current event to provide additional context
-        event = self.coordinator.current_event
-        return {
-            ATTR_EVENT_TYPE: event.event_type.value if event else STATE_UNKNOWN,
-            ATTR_EVENT_START: event.start.isoformat() if event else None,
-            ATTR_EVENT_END: event.end.isoformat() if event else None,
-        }
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """Compute state and attributes from coordinator data."""
+        description = self.entity_description
+        self._attr_native_value = description.val_func(self.coordinator)
+        if description.attrs_func is not None:
+            self._attr_extra_state_attributes = description.attrs_func(self.coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh state and attributes before writing them to HA."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
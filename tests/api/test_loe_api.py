@@ -0,0 +1,281 @@
+"""Tests for LOE Lviv Outages API."""
+
+import datetime
+
+import pytest
+
+from custom_components.loe_outages.api.loe_api import (
+    KIEV_TZ,
+    LoeApi,
+    find_current_and_next_outage,
+)
+from custom_components.loe_outages.api.models import OutageEvent, OutageEventType
+
+SCHEDULE_TEXT = (
+    "Графік погодинних відключень на 27.01.2025 "
+    "Інформація станом на 09:15 27.01.2025 "
+    "Група 1.1. Електроенергії немає з 14:00 до 16:00, з 08:00 до 10:00. "
+    "Група 1.2. Електроенергії немає з 22:00 до 24:00."
+)
+
+
+@pytest.fixture(name="api")
+def _api():
+    """Create an API instance with parsed schedule."""
+    api = LoeApi(group="1.1")
+    api.schedule_text = SCHEDULE_TEXT
+    api._parse_schedule_text()
+    return api
+
+
+class TestExtractScheduleText:
+    """Test schedule text extraction from API response."""
+
+    def test_html_stripped(self):
+        """Test tags, comments and entities are handled by the parser."""
+        api = LoeApi()
+        api.raw_data = {
+            "hydra:member": [
+                {
+                    "menuItems": [
+                        {
+                            "rawHtml": (
+                                '<p class="a>b">Група&nbsp;1.1.</p><!-- x > y -->'
+                                "<p>з 08:00 до&#160;10:00</p>"
+                            )
+                        }
+                    ]
+                }
+            ]
+        }
+        api._extract_schedule_text()
+        assert api.schedule_text == "Група 1.1. з 08:00 до 10:00"
+
+
+class TestParseScheduleText:
+    """Test schedule text parsing."""
+
+    def test_schedule_date(self, api):
+        """Test schedule date is parsed."""
+        assert api.schedule_date == datetime.date(2025, 1, 27)
+
+    def test_updated_on(self, api):
+        """Test update timestamp is parsed in Kyiv timezone."""
+        assert api.updated_on == datetime.datetime(2025, 1, 27, 9, 15, tzinfo=KIEV_TZ)
+
+    def test_missing_update_time(self):
+        """Test schedule date is parsed when update time is absent."""
+        api = LoeApi()
+        api.schedule_text = "Графік погодинних відключень на 27.01.2025 Група 1.1."
+        api._parse_schedule_text()
+        assert api.schedule_date == datetime.date(2025, 1, 27)
+        assert api.updated_on is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Інформація станом на 09:15 27.01.2025 "
+            "Графік погодинних відключень на 27.01.2025",
+            "Інформація станом на 09:15 27.01.2025",
+        ],
+    )
+    def test_update_time_without_following_date(self, text):
+        """Test update time is parsed when not preceded by the schedule date."""
+        api = LoeApi()
+        api.schedule_text = text
+        api._parse_schedule_text()
+        assert api.updated_on == datetime.datetime(2025, 1, 27, 9, 15, tzinfo=KIEV_TZ)
+
+    def test_group_schedules_sorted(self, api):
+        """Test group time ranges are sorted by start."""
+        assert api.group_schedules["1.1"] == ((480, 600), (840, 960))
+        assert api.group_schedules["1.2"] == ((1320, 1440),)
+
+    def test_range_crossing_midnight(self):
+        """Test range ending before its start is clamped to end of day."""
+        api = LoeApi()
+        api.schedule_text = (
+            "Графік погодинних відключень на 27.01.2025 "
+            "Група 1.1. Електроенергії немає з 23:00 до 01:00."
+        )
+        api._parse_schedule_text()
+        assert api.group_schedules["1.1"] == ((1380, 1440),)
+
+    def test_overlapping_ranges_joined(self):
+        """Test nested, overlapping and touching ranges become disjoint."""
+        api = LoeApi()
+        api.schedule_text = (
+            "Графік погодинних відключень на 27.01.2025 "
+            "Група 1.1. Електроенергії немає з 00:00 до 04:00, з 02:00 до 03:00, "
+            "з 04:00 до 08:00, з 07:00 до 09:00, з 12:00 до 13:00."
+        )
+        api._parse_schedule_text()
+        assert api.group_schedules["1.1"] == ((0, 540), (720, 780))
+
+    def test_invalid_range_skipped(self):
+        """Test out-of-range times are dropped instead of rolling over."""
+        api = LoeApi()
+        api.schedule_text = (
+            "Графік погодинних відключень на 27.01.2025 "
+            "Група 1.1. Електроенергії немає з 25:00 до 26:00, з 08:00 до 10:00."
+        )
+        api._parse_schedule_text()
+        assert api.group_schedules["1.1"] == ((480, 600),)
+
+    def test_non_ascii_digits_ignored(self):
+        """Test ranges written with non-ASCII digits are not matched."""
+        api = LoeApi()
+        api.schedule_text = (
+            "Графік погодинних відключень на 27.01.2025 "
+            "Група 1.1. Електроенергії немає "
+            "з \uff10\uff18:00 до 10:00, з 14:00 до 16:00."
+        )
+        api._parse_schedule_text()
+        assert api.group_schedules["1.1"] == ((840, 960),)
+
+
+@pytest.mark.parametrize(
+    ("time_str", "minutes"),
+    [("00:00", 0), ("08:30", 510), ("19:05", 1145), ("24:00", 1440)],
+)
+def test_time_str_to_minutes(time_str, minutes):
+    """Test HH:MM conversion to minutes since midnight."""
+    assert LoeApi._time_str_to_minutes(time_str) == minutes
+
+
+@pytest.mark.parametrize("time_str", ["24:30", "25:00", "08:60"])
+def test_time_str_to_minutes_invalid(time_str):
+    """Test times outside of a day are rejected."""
+    with pytest.raises(ValueError, match=time_str):
+        LoeApi._time_str_to_minutes(time_str)
+
+
+class TestGetEventsForGroup:
+    """Test building outage events."""
+
+    def test_events(self, api):
+        """Test events are built in chronological order."""
+        events = api.get_events_for_group("1.1")
+        assert [(e.start.hour, e.end.hour) for e in events] == [(8, 10), (14, 16)]
+        assert events[0].start.tzinfo is KIEV_TZ
+
+    def test_end_of_day(self, api):
+        """Test 24:00 maps to midnight of the next day."""
+        (event,) = api.get_events_for_group("1.2")
+        assert event.end == datetime.datetime(2025, 1, 28, 0, 0, tzinfo=KIEV_TZ)
+
+    def test_unknown_group(self, api):
+        """Test unknown group has no events."""
+        assert api.get_events_for_group("6.2") == ()
+
+    def test_cached_until_reparse(self, api):
+        """Test events are reused until the schedule is parsed again."""
+        events = api.get_events_for_group("1.1")
+        assert api.get_events_for_group("1.1") is events
+
+        api._parse_schedule_text()
+        assert api.get_events_for_group("1.1") is not events
+
+
+class TestEventLookup:
+    """Test current/next/range event lookups."""
+
+    @staticmethod
+    def _at(hour: int, minute: int = 0) -> datetime.datetime:
+        return datetime.datetime(2025, 1, 27, hour, minute, tzinfo=KIEV_TZ)
+
+    def test_current_event(self, api):
+        """Test current event covers [start, end)."""
+        assert api.get_current_event(self._at(7, 59)) is None
+        assert api.get_current_event(self._at(8)).start == self._at(8)
+        assert api.get_current_event(self._at(9, 59)).start == self._at(8)
+        assert api.get_current_event(self._at(10)) is None
+
+    def test_next_event(self, api):
+        """Test next event starts strictly after the given time."""
+        assert api.get_current_and_next(self._at(7))[1].start == self._at(8)
+        assert api.get_current_and_next(self._at(8))[1].start == self._at(14)
+        assert api.get_current_and_next(self._at(14))[1] is None
+
+    def test_events_between(self, api):
+        """Test range lookup includes events running into the range."""
+        events = api.get_events_between(self._at(9), self._at(15))
+        assert [e.start.hour for e in events] == [8, 14]
+        assert api.get_events_between(self._at(11), self._at(13)) == []
+
+    def test_events_between_touching_bounds(self, api):
+        """Test events only touching the range bounds are excluded."""
+        assert api.get_events_between(self._at(10), self._at(14)) == []
+
+    def test_current_and_next(self, api):
+        """Test current and next events are found in one lookup."""
+        current, next_event = api.get_current_and_next(self._at(9))
+        assert current.start == self._at(8)
+        assert next_event.start == self._at(14)
+        assert api.get_current_and_next(self._at(17)) == (None, None)
+
+    def test_nested_ranges(self):
+        """Test an outage enclosing a shorter one is found throughout."""
+        api = LoeApi(group="1.1")
+        api.schedule_text = (
+            "Графік погодинних відключень на 27.01.2025 "
+            "Група 1.1. Електроенергії немає з 00:00 до 12:00, з 02:00 до 03:00."
+        )
+        api._parse_schedule_text()
+
+        current, next_event = api.get_current_and_next(self._at(3, 30))
+        assert (current.start, current.end) == (self._at(0), self._at(12))
+        assert next_event is None
+        assert api.get_events_between(self._at(4), self._at(11)) == [current]
+
+
+def _hour(hour: int) -> datetime.datetime:
+    return datetime.datetime(2025, 1, 27, hour, tzinfo=KIEV_TZ)
+
+
+def _event(start: int, end: int) -> OutageEvent:
+    return OutageEvent(
+        event_type=OutageEventType.DEFINITE, start=_hour(start), end=_hour(end)
+    )
+
+
+class TestFindCurrentAndNextOutage:
+    """Test current/next outage lookup."""
+
+    events = (_event(8, 10), _event(14, 16))
+
+    def test_empty(self):
+        """Test no events yield neither current nor next."""
+        assert find_current_and_next_outage([], _hour(9)) == (None, None)
+
+    def test_before_first(self):
+        """Test only the next outage is found before the first one."""
+        assert find_current_and_next_outage(list(self.events), _hour(7)) == (
+            None,
+            self.events[0],
+        )
+
+    def test_during_outage(self):
+        """Test outage in progress covers [start, end)."""
+        events = list(self.events)
+        assert find_current_and_next_outage(events, _hour(8)) == tuple(events)
+        assert find_current_and_next_outage(events, _hour(10)) == (None, events[1])
+
+    def test_after_last(self):
+        """Test nothing is found after the last outage ends."""
+        assert find_current_and_next_outage(list(self.events), _hour(17)) == (
+            None,
+            None,
+        )
+
+    def test_horizon(self):
+        """Test next outage starting at or past the horizon is dropped."""
+        events = list(self.events)
+        assert find_current_and_next_outage(events, _hour(9), horizon=_hour(14)) == (
+            events[0],
+            None,
+        )
+        assert find_current_and_next_outage(events, _hour(9), horizon=_hour(15)) == (
+            events[0],
+            events[1],
+        )
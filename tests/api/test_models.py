@@ -35,6 +35,15 @@ class TestOutageEvent:
         assert event.end == end
         assert event.event_type == OutageEventType.DEFINITE
 
+    def test_uid(self):
+        """Test that event uid is derived from start."""
+        event = OutageEvent(
+            event_type=OutageEventType.DEFINITE,
+            start=datetime.datetime(2025, 1, 27, 10, 0, 0),
+            end=datetime.datetime(2025, 1, 27, 12, 0, 0),
+        )
+        assert event.uid == "outage-2025-01-27T10:00:00"
+
     def test_frozen(self):
         """Test that event is frozen."""
         event = OutageEvent(
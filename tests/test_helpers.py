@@ -0,0 +1,60 @@
+"""Tests for LOE Lviv Outages helpers."""
+
+import datetime
+import zoneinfo
+
+from custom_components.loe_outages.api.models import OutageEvent, OutageEventType
+from custom_components.loe_outages.helpers import (
+    merge_consecutive_outages,
+    to_isoformat,
+)
+
+KYIV_TZ = zoneinfo.ZoneInfo("Europe/Kyiv")
+
+
+def _at(hour: int) -> datetime.datetime:
+    return datetime.datetime(2025, 1, 27, hour, tzinfo=KYIV_TZ)
+
+
+def _event(start: int, end: int) -> OutageEvent:
+    return OutageEvent(
+        event_type=OutageEventType.DEFINITE, start=_at(start), end=_at(end)
+    )
+
+
+class TestToIsoformat:
+    """Test memoized ISO formatting."""
+
+    def test_none(self):
+        """Test None passes through."""
+        assert to_isoformat(None) is None
+
+    def test_date(self):
+        """Test date formatting."""
+        assert to_isoformat(datetime.date(2025, 1, 27)) == "2025-01-27"
+
+    def test_equal_instants_in_other_timezones(self):
+        """Test equal aware datetimes keep their own offset."""
+        kyiv = datetime.datetime(2025, 1, 27, 10, 0, tzinfo=KYIV_TZ)
+        utc = kyiv.astimezone(datetime.UTC)
+        assert kyiv == utc
+        assert to_isoformat(kyiv) == "2025-01-27T10:00:00+02:00"
+        assert to_isoformat(utc) == "2025-01-27T08:00:00+00:00"
+
+
+class TestMergeConsecutiveOutages:
+    """Test merging of back-to-back outages."""
+
+    def test_empty(self):
+        """Test no events merge to nothing."""
+        assert merge_consecutive_outages([]) == []
+
+    def test_back_to_back_merged(self):
+        """Test events touching at the boundary become one outage."""
+        merged = merge_consecutive_outages([_event(8, 10), _event(10, 12)])
+        assert [(e.start, e.end) for e in merged] == [(_at(8), _at(12))]
+
+    def test_gap_kept(self):
+        """Test events separated by a gap stay apart."""
+        events = [_event(8, 10), _event(14, 16)]
+        assert merge_consecutive_outages(events) == events